@@ -28,23 +28,24 @@ class Ramses(MakefilePackage):
 
     depends_on("mpi")
 
-    parallel = False
-
     def edit(self, spec, prefix):
-        os.chdir(os.path.join(os.getcwd(), "SRC", "bin"))
-        makefile = FileFilter("Makefile")
-        makefile.filter(r"^PREFIX := .*", f"PREFIX = {prefix}")
-        if self.compiler.name == "intel":
-            env["I_MPI_F90"] = spack_fc
-            fc = spec["mpi"].mpifc
-            makefile.filter(r"^F90 = .*", f"F90 = {fc}")
-        else:
+        if self.compiler.name != "intel":
             msg = f"The compiler [{self.compiler.name}] is not supported yet."
             msg += "\nThis test only works with the intel compiler."
             raise InstallError(msg)
 
+        # the MPI compiler wrapper calls Spack's compiler wrapper, which adds target and user flags
+        env["I_MPI_F90"] = spack_fc
+
+        os.chdir(os.path.join(os.getcwd(), "SRC", "bin"))
+        makefile_vars = {"PREFIX": prefix, "F90": spec["mpi"].mpifc}
+        FileFilter("Makefile").filter(
+            r"^(PREFIX|F90) :?= .*", lambda m: f"{m.group(1)} = {makefile_vars[m.group(1)]}"
+        )
+
     def build(self, spec, prefix):
-        make()
+        # NOTE: Fortran module dependencies are not known to be safe for parallel make
+        make(parallel=False)
 
     def install(self, spec, prefix):
         make("install")
@@ -22,12 +22,12 @@ class Sphng(MakefilePackage):
 
     version("v1.0.0", tag="v1.0.0")
 
+    variant("ipo", default=True, description="enable interprocedural optimization")
+
     executables = [r"^sph_tree_rk_gradh$"]
 
     depends_on("mpi")
 
-    parallel = False
-
     def edit(self, spec, prefix):
         self.fc = spack_fc if "~mpi" in spec else spec["mpi"].mpifc
 
@@ -37,12 +37,20 @@ class Sphng(MakefilePackage):
         env["openmp"] = "yes"
 
         env["FC"] = self.fc
+        # make Intel MPI's Fortran wrapper (FC) call ifort through Spack's compiler wrapper
+        env["I_MPI_F90"] = spack_fc
         env["OMPFLAG"] = self.compiler.openmp_flag
         if self.compiler.name == "intel":
+            # NOTE: target flags are kept explicitly for builds whose MPI wrapper is not routed through
+            # Spack's compiler wrapper (I_MPI_F90 only applies to Intel MPI), as they would be missing there
+            target_flags = spec.target.optimization_flags(self.compiler)
             fflags = (
-                "-O3 -mavx2 -mfma -mcmodel=medium -warn uninitialized -warn truncated_source "
+                f"-O3 {target_flags} -mcmodel=medium -warn uninitialized -warn truncated_source "
                 "-warn interfaces -nogen-interfaces -DINCMPI"
             )
+            if "+ipo" in spec:
+                fflags += " -ipo"
+                env["LDFLAGS"] = "-ipo"
             env["DBLFLAG"] = "-r8"
             env["DEBUGFLAG"] = "-check all -traceback -g -fpe0 -fp-stack-check -heap-arrays -O0"
             env["ENDIANFLAGBIG"] = "-convert big_endian"
@@ -52,10 +60,13 @@ class Sphng(MakefilePackage):
             msg += "\nThis test only works with the intel compiler."
             raise InstallError(msg)
 
-        env["FFLAGS"] = fflags
+        # NOTE: Spack's compiler wrapper adds user-specified flags (e.g. `spack install sphng fflags="..."`)
+        # ahead of FFLAGS; they are repeated here so they can override the package flags (e.g. -O3)
+        env["FFLAGS"] = " ".join([fflags] + spec.compiler_flags["fflags"])
 
     def build(self, spec, prefix):
-        make("gradhrk")
+        # NOTE: Fortran module dependencies are not known to be safe for parallel make
+        make("gradhrk", parallel=False)
 
     def install(self, spec, prefix):
         make("install")
@@ -2,6 +2,12 @@ from pathlib import Path
 
 import yaml
 
+# prefer the faster libyaml parser when available
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class ConfigHandler:
 
@@ -225,7 +231,7 @@ def load_config(file):
         Args:
             file: file, config yaml.
     """
-    return yaml.safe_load(file)
+    return yaml.load(file, Loader=SafeLoader)
 
 
 def read_config(config: dict):
@@ -5,11 +5,15 @@ import traceback
 from functools import reduce
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from config_handler import ConfigHandler
 from perflog_handler import PerflogHandler
 from plot_handler import plot_generic
 
+# defer copying dataframe data until it is modified
+pd.set_option("mode.copy_on_write", True)
+
 
 class PostProcessing:
 
@@ -33,9 +37,14 @@ class PostProcessing:
         # find and read perflogs
         self.original_df = PerflogHandler(log_path, self.debug).get_df()
         # copy original data for modification during post-processing
-        self.df = self.original_df.copy()
+        # NOTE: with copy-on-write, only modified columns are actually copied
+        self.df = self.original_df.copy(deep=False)
         # dataframe filters
-        self.mask = pd.Series(self.df.index.notnull())
+        self.mask = self.df.index.notnull()
+        # incremented whenever the dataframe or its mask changes
+        self.mask_version = 0
+        # values derived from the dataframe by the user interface, cleared whenever the dataframe or its mask changes
+        self.ui_cache = None
         # plot placeholder
         self.plot = None
 
@@ -51,6 +60,8 @@ class PostProcessing:
         # FIXME (issue #265): consider hiding typing + sorting from user
         # because these steps must happen every time at the start
 
+        # dataframe and mask are about to change
+        self.mask_version += 1
         # apply column types
         self.apply_df_types(config.all_columns, config.column_types)
         # sort rows
@@ -65,16 +76,16 @@ class PostProcessing:
             config.x_axis["value"], config.y_axis["value"], *config.get_y_scaling(), config.series_filters)
         if self.debug:
             print("Selected dataframe:")
-            print(self.df[self.mask][config.plot_columns + config.extra_columns])
+            print(self.df.loc[self.mask, config.plot_columns + config.extra_columns])
         if self.save:
             # set index=False to exclude the dataframe index from the csv
-            self.df[self.mask][config.plot_columns + config.extra_columns].to_csv(
+            self.df.loc[self.mask, config.plot_columns + config.extra_columns].to_csv(
                 path_or_buf=os.path.join(Path(__file__).parent, 'output.csv'), index=True)
 
         # call a plotting script
         if self.plotting:
             self.plot = plot_generic(
-                config.title, self.df[self.mask][config.plot_columns],
+                config.title, self.df.loc[self.mask, config.plot_columns],
                 config.x_axis, config.y_axis, config.series_filters, self.debug)
 
         # FIXME (#issue #255): maybe save this bit to a file as well for easier viewing
@@ -83,7 +94,7 @@ class PostProcessing:
             print("Full dataframe:")
             print(self.df.to_json(orient="columns", indent=2))
 
-        return self.df[self.mask][config.plot_columns]
+        return self.df.loc[self.mask, config.plot_columns]
 
     def check_df_columns(self, all_columns: 'list[str]'):
         """
@@ -113,6 +124,7 @@ class PostProcessing:
         # validate columns
         self.check_df_columns(all_columns)
 
+        conversion_types = {}
         for col in all_columns:
             if column_types.get(col):
 
@@ -120,12 +132,18 @@ class PostProcessing:
                 # skip type conversion if column is already the desired type
                 if conversion_type == self.df[col].dtype:
                     continue
-                # otherwise apply type to column
-                self.df[col] = self.original_df[col].copy().astype(conversion_type)
+                # otherwise mark column for conversion
+                conversion_types[col] = conversion_type
 
             else:
                 raise KeyError("Could not find user-specified type for column", col)
 
+        # apply types to all marked columns at once
+        if conversion_types:
+            columns = list(conversion_types)
+            self.df[columns] = self.original_df[columns].astype(conversion_types)
+            self.mask_version += 1
+
     def convert_type_to_dtype(self, user_type: str, col: str):
         """
             Return a valid pandas dtype converted from a user-specified type.
@@ -178,7 +196,7 @@ class PostProcessing:
     def filter_df(self, and_filters: 'list[list[str]]', or_filters: 'list[list[str]]',
                   series_filters: 'list[list[str]]'):
         """
-            Return a mask for the given dataframe based on user-specified filter conditions.
+            Return a boolean array mask for the given dataframe based on user-specified filter conditions.
 
             Args:
                 and_filters: list[list[str]], filter conditions to be concatenated together with logical AND.
@@ -195,8 +213,11 @@ class PostProcessing:
         # apply series filters
         if series_filters:
             mask &= reduce(op.or_, (self.row_filter(f, self.df) for f in series_filters))
+        # NOTE: a plain boolean array avoids index alignment each time the mask is applied
+        # treat missing comparison results as filtered away
+        mask = mask.to_numpy(dtype=bool, na_value=False)
         # ensure not all rows are filtered away
-        if self.df[mask].empty:
+        if not mask.any():
             raise pd.errors.EmptyDataError("Filtered dataframe is empty", self.df[mask].index)
 
         return mask
@@ -217,12 +238,12 @@ class PostProcessing:
         # get number of column combinations
         series_combinations = reduce(op.mul, list(series_col_count.values()), 1)
         num_filtered_rows = len(self.df[self.mask])
-        num_x_data_points = series_combinations * len(set(self.df[self.mask][x_column]))
+        num_x_data_points = series_combinations * len(set(self.df.loc[self.mask, x_column]))
         # check expected number of rows
         if num_filtered_rows > num_x_data_points:
             raise RuntimeError(
                 "Unexpected number of rows ({0}) does not match number of unique x-axis values per series ({1})"
-                .format(num_filtered_rows, num_x_data_points), self.df[self.mask][plot_columns])
+                .format(num_filtered_rows, num_x_data_points), self.df.loc[self.mask, plot_columns])
 
     def transform_df_data(self, x_column: str, y_column: str, scaling_column: dict,
                           scaling_custom: 'float | list[float]', series_filters: 'list[list[str]]'):
@@ -352,14 +373,14 @@ class PostProcessing:
 
         return mask
 
-    def transform_axis(self, mask: 'pd.Series[bool]', axis_column: str, scaling_value: pd.Series,
+    def transform_axis(self, mask: 'np.ndarray | pd.Series[bool]', axis_column: str, scaling_value: pd.Series,
                        scaling_series_mask: 'pd.Series[bool]', scaling_x_value_mask: 'pd.Series[bool]',
                        scaling_column_name: str, scaling_custom: 'float | list[float]'):
         """
             Divide axis values by specified values and reflect this change in the dataframe.
 
             Args:
-                mask: pd.Series[bool], dataframe filters.
+                mask: np.ndarray | pd.Series[bool], dataframe filters.
                 axis_column: str, name of axis column to scale.
                 scaling_value: pd.Series, copy of column containing values to scale by.
                 scaling_series_mask: pd.Series[bool], a series mask to be applied to the scaling column.
@@ -376,12 +397,12 @@ class PostProcessing:
         elif scaling_column_name:
 
             # check types
-            if (not pd.api.types.is_float_dtype(self.df[mask][axis_column].dtype) or
+            if (not pd.api.types.is_float_dtype(self.df[axis_column].dtype) or
                 not pd.api.types.is_numeric_dtype(scaling_value.dtype)):
                 # scaled column must be float to avoid casting issues and scaling column must be numeric
                 raise TypeError("{0} {1}".format(
                     "Cannot scale column '{0}' of type {1} by column '{2}' of type {3}."
-                    .format(axis_column, self.df[mask][axis_column].dtype,
+                    .format(axis_column, self.df[axis_column].dtype,
                             scaling_column_name, scaling_value.dtype),
                     "Scaled column must be float and scaling column must be numeric."))
 
@@ -397,7 +418,7 @@ class PostProcessing:
                              else scaling_value[scaling_mask].values)
 
         # apply scaling
-        self.df.loc[mask, axis_column] = self.df[mask][axis_column].values / scaling_value
+        self.df.loc[mask, axis_column] = self.df.loc[mask, axis_column].values / scaling_value
         # FIXME (issue #253): add this as a config option at some point in conjunction with dropping NaNs
         # df[axis_column].replace(to_replace=1, value=np.NaN, inplace=True)
 
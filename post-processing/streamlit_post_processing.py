@@ -2,6 +2,7 @@ import argparse
 import traceback
 from pathlib import Path
 
+import pyarrow as pa
 import streamlit as st
 from config_handler import ConfigHandler, load_config, read_config
 from post_processing import PostProcessing
@@ -9,6 +10,8 @@ from post_processing import PostProcessing
 # drop-down lists
 operators = ["==", "!=", "<", ">", "<=", ">="]
 column_types = ["datetime", "int", "float", "str"]
+# user type to drop-down index mapping
+column_type_index = {t: i for i, t in enumerate(column_types)}
 filter_types = ["and", "or", "series"]
 # pandas to user type mapping
 type_lookup = {"datetime64[ns]": "datetime",
@@ -20,15 +23,122 @@ dtype_lookup = {"datetime": "datetime64[ns]",
                 "float": "float64",
                 "int": "Int64",
                 "str": "object"}
+# FIXME (issue #300): inherit max width can be too large for sidebar
+# allow wide multiselect labels
+multiselect_style = """
+    <style>
+        .stMultiSelect [data-baseweb=select] span{
+            max-width: inherit;
+        }
+    </style>"""
 
 
-def update_ui(post: PostProcessing, config: ConfigHandler, e: 'Exception | None' = None):
+def _post_cache(post: PostProcessing):
     """
-        Create an interactive user interface for post-processing using Streamlit.
+        Return a dictionary of values derived from the dataframe, stored on the post-processing instance
+        (i.e. per session) and cleared whenever the dataframe or its mask changes.
 
         Args:
             post: PostProcessing, class containing performance log data and filter information.
-            config: ConfigHandler, class containing configuration information for plotting.
+    """
+
+    cache = post.ui_cache
+    # NOTE: the dataframe is compared by identity, as it is replaced when post-processing is re-run
+    if cache is None or cache["df"] is not post.df or cache["mask_version"] != post.mask_version:
+        cache = post.ui_cache = {"df": post.df, "mask_version": post.mask_version}
+    return cache
+
+
+def _masked_df(post: PostProcessing):
+    """
+        Return the filtered dataframe, recomputed only when the dataframe or its mask changes.
+
+        Args:
+            post: PostProcessing, class containing performance log data and filter information.
+    """
+
+    cache = _post_cache(post)
+    if "masked_df" not in cache:
+        cache["masked_df"] = post.df[post.mask]
+    return cache["masked_df"]
+
+
+def _arrow_view(post: PostProcessing, columns: 'tuple[str]'):
+    """
+        Return the filtered dataframe as an Arrow table, the format Streamlit sends to the frontend,
+        recomputed only when the dataframe, its mask, or the displayed columns change.
+
+        Args:
+            post: PostProcessing, class containing performance log data and filter information.
+            columns: tuple[str], names of columns to display (all columns if empty).
+    """
+
+    cache = _post_cache(post)
+    if ("arrow_view", columns) not in cache:
+        df = _masked_df(post)
+        if columns:
+            df = df.loc[:, list(columns)]
+        try:
+            cache[("arrow_view", columns)] = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # let Streamlit handle columns with mixed types
+            cache[("arrow_view", columns)] = df
+    return cache[("arrow_view", columns)]
+
+
+def _user_types(post: PostProcessing):
+    """
+        Return the user type of every dataframe column, recomputed only when the dataframe or its mask changes.
+
+        Args:
+            post: PostProcessing, class containing performance log data and filter information.
+    """
+
+    cache = _post_cache(post)
+    if "user_types" not in cache:
+        cache["user_types"] = {col: type_lookup.get(str(dtype)) for col, dtype in post.df.dtypes.items()}
+    return cache["user_types"]
+
+
+def _unique_sorted(post: PostProcessing, col: str, masked=False):
+    """
+        Return a list of the sorted unique values of a dataframe column, recomputed only when
+        the dataframe or its mask changes.
+
+        Args:
+            post: PostProcessing, class containing performance log data and filter information.
+            col: str, column name.
+            masked: bool, flag to only consider rows of the filtered dataframe.
+    """
+
+    cache = _post_cache(post)
+    if ("unique_sorted", col, masked) not in cache:
+        df = _masked_df(post) if masked else post.df
+        cache[("unique_sorted", col, masked)] = df[col].drop_duplicates().sort_values().tolist()
+    return cache[("unique_sorted", col, masked)]
+
+
+@st.cache_data(max_entries=16)
+def _load_config(config: bytes):
+    """
+        Return a loaded config dictionary, re-parsed only for previously unseen file contents.
+
+        Args:
+            config: bytes, contents of config yaml.
+    """
+
+    return load_config(config)
+
+
+def update_ui(post: 'PostProcessing | None', config: 'ConfigHandler | None', e: 'Exception | None' = None):
+    """
+        Create an interactive user interface for post-processing using Streamlit.
+
+        Args:
+            post: PostProcessing | None, class containing performance log data and filter information
+                (only used to initialise the session state).
+            config: ConfigHandler | None, class containing configuration information for plotting
+                (only used to initialise the session state).
             e: Exception | None, a potential config validation error (only used for user information).
     """
 
@@ -37,6 +147,10 @@ def update_ui(post: PostProcessing, config: ConfigHandler, e: 'Exception | None'
     if state.get("post") is None:
         state.post = post
         state.config = config
+        # column name to drop-down index mapping
+        state.col_index = {c: i for i, c in enumerate(post.df.columns)}
+        # (filter list, column) to user type that filter values were last interpreted as
+        state.filter_value_types = {}
         # display initial config validation error, if present, and clear upon page reload
         if e:
             st.exception(e)
@@ -51,11 +165,8 @@ def update_ui(post: PostProcessing, config: ConfigHandler, e: 'Exception | None'
     # display dataframe data
     show_df = st.toggle("Show DataFrame")
     if show_df:
-        if len(config.plot_columns + config.extra_columns) > 0:
-            st.dataframe(post.df[post.mask][config.plot_columns + config.extra_columns],
-                         hide_index=True, use_container_width=True)
-        else:
-            st.dataframe(post.df[post.mask], hide_index=True, use_container_width=True)
+        st.dataframe(_arrow_view(post, tuple(config.plot_columns + config.extra_columns)),
+                     hide_index=True, use_container_width=True)
 
     # display config in current session state
     show_config = st.toggle("Show Config", key="show_config")
@@ -103,8 +214,10 @@ def update_config():
     state = st.session_state
     uploaded_config = state.uploaded_config
     if uploaded_config:
+        # uploaded filter values have not been interpreted as any type yet
+        state.filter_value_types = {}
         try:
-            config_dict = load_config(uploaded_config)
+            config_dict = _load_config(uploaded_config.getvalue())
             state.config = ConfigHandler(config_dict)
             # update dataframe types
             state.post.apply_df_types(state.config.all_columns, state.config.column_types)
@@ -148,24 +261,25 @@ def axis_select(label: str, axis: dict):
             axis: dict, axis column, units, and scaling from config.
     """
 
-    df = st.session_state.post.df
+    state = st.session_state
+    df = state.post.df
     # default drop-down selections
-    type_index = column_types.index(type_lookup.get(str(df[axis["value"]].dtype))) if axis.get("value") else 0
-    column_index = list(df.columns).index(axis["value"]) if axis.get("value") in df.columns else None
+    type_index = column_type_index[_user_types(state.post)[axis["value"]]] if axis.get("value") else 0
+    column_index = state.col_index.get(axis.get("value"))
 
     # axis information drop-downs
     axis_type, axis_column = st.columns(2)
     # type select
     with axis_type:
-        st.selectbox("{0}-axis column type".format(label), column_types,
-                     key="{0}_axis_type".format(label), index=type_index)
+        st.selectbox(f"{label}-axis column type", column_types,
+                     key=f"{label}_axis_type", index=type_index)
     # column select
     with axis_column:
-        st.selectbox("{0}-axis column".format(label), df.columns,
-                     key="{0}_axis_column".format(label), index=column_index)
+        st.selectbox(f"{label}-axis column", df.columns,
+                     key=f"{label}_axis_column", index=column_index)
     # warn if no axis column is selected
-    if not st.session_state["{0}_axis_column".format(label)]:
-        st.warning("Missing {0}-axis value information.".format(label))
+    if not st.session_state[f"{label}_axis_column"]:
+        st.warning(f"Missing {label}-axis value information.")
 
     # units select
     units_select(label, axis)
@@ -189,23 +303,23 @@ def units_select(label: str, axis: dict):
     units_index = None
     if axis.get("units"):
         if axis["units"].get("column"):
-            units_index = list(df.columns).index(axis["units"]["column"])
+            units_index = st.session_state.col_index.get(axis["units"]["column"])
 
     units_column, units_custom = st.columns(2)
     # units select
     with units_column:
         # NOTE: initialising with index=None allows value to be cleared, but doesn't allow a default value
-        st.selectbox("{0}-axis units column".format(label), df.columns, placeholder="None",
-                     key="{0}_axis_units_column".format(label), index=units_index)
+        st.selectbox(f"{label}-axis units column", df.columns, placeholder="None",
+                     key=f"{label}_axis_units_column", index=units_index)
     # set custom units
     with units_custom:
-        st.text_input("{0}-axis units custom".format(label),
+        st.text_input(f"{label}-axis units custom",
                       axis["units"].get("custom") if axis.get("units") else None,
-                      placeholder="None", key="{0}_axis_units_custom".format(label),
+                      placeholder="None", key=f"{label}_axis_units_custom",
                       help="Assign a custom units label. Will clear the units column selection.")
 
-    st.button("Clear Units", key="clear_{0}_axis_units".format(label), on_click=clear_fields,
-              args=[["{0}_axis_units_column".format(label), "{0}_axis_units_custom".format(label)]])
+    st.button("Clear Units", key=f"clear_{label}_axis_units", on_click=clear_fields,
+              args=[[f"{label}_axis_units_column", f"{label}_axis_units_custom"]])
 
 
 def clear_fields(field_keys: 'list[str]'):
@@ -233,8 +347,7 @@ def scaling_select(axis: dict):
 
     # scaling value selection columns
     series_col = state.config.series_filters
-    x_col = (list(df[state.post.mask][state.x_axis_column].drop_duplicates().sort_values())
-             if state.x_axis_column else [])
+    x_col = _unique_sorted(state.post, state.x_axis_column, masked=True) if state.x_axis_column else []
 
     # default drop-down selections
     type_index = 0
@@ -244,8 +357,8 @@ def scaling_select(axis: dict):
     if axis.get("scaling"):
         if axis["scaling"].get("column"):
             if axis["scaling"]["column"].get("name"):
-                type_index = column_types.index(type_lookup.get(str(df[axis["scaling"]["column"]["name"]].dtype)))
-                scaling_index = list(df.columns).index(axis["scaling"]["column"]["name"])
+                type_index = column_type_index[_user_types(state.post)[axis["scaling"]["column"]["name"]]]
+                scaling_index = state.col_index.get(axis["scaling"]["column"]["name"])
             if axis["scaling"]["column"].get("series") is not None:
                 series_index = int(axis["scaling"]["column"]["series"])
             if axis["scaling"]["column"].get("x_value") and len(x_col) > 0:
@@ -333,37 +446,47 @@ def update_types():
         Apply user-selected types to session state config and dataframe.
     """
 
-    post = st.session_state.post
-    config = st.session_state.config
+    state = st.session_state
+    post = state.post
+    config = state.config
 
     # re-parse column names
     config.parse_columns()
     # remove redundant types from config
     config.remove_redundant_types()
+    # skip re-typing if nothing has changed since the last successful update
+    if state.get("types_key") == _types_key(post, config):
+        return
     try:
         # update dataframe types
         post.apply_df_types(config.all_columns, config.column_types)
+        state.types_key = _types_key(post, config)
     except Exception as e:
         st.exception(e)
         post.plot = None
 
 
+def _types_key(post: PostProcessing, config: ConfigHandler):
+    """
+        Return a key that changes whenever the config columns, their types, or the dataframe change.
+
+        Args:
+            post: PostProcessing, class containing performance log data and filter information.
+            config: ConfigHandler, class containing configuration information for plotting.
+    """
+
+    # NOTE: mask_version is incremented whenever the dataframe is modified or replaced
+    return tuple(config.all_columns), frozenset(config.column_types.items()), post.mask_version
+
+
 def filter_options():
     """
         Display filter options interface.
     """
 
     st.write("#### Filter Options")
-    # FIXME (issue #300): inherit max width can be too large for sidebar
-    # allow wide multiselect labels
-    st.markdown(
-        """
-        <style>
-            .stMultiSelect [data-baseweb=select] span{
-                max-width: inherit;
-            }
-        </style>""",
-        unsafe_allow_html=True)
+    # NOTE: must be re-emitted on every run, as Streamlit removes elements that are not re-emitted during a rerun
+    st.markdown(multiselect_style, unsafe_allow_html=True)
 
     # display current filters
     current_filters()
@@ -425,8 +548,8 @@ def new_filter_options():
         c1, c2 = st.columns(2)
         with c1:
             # display contents of currently selected filter column
-            filter_col = post.df[state.filter_col].drop_duplicates()
-            st.selectbox("column filter value", filter_col.sort_values(), key="filter_val", index=None)
+            filter_col = _unique_sorted(post, state.filter_col)
+            st.selectbox("column filter value", filter_col, key="filter_val", index=None)
         with c2:
             st.text_input("custom filter value", None, placeholder="None", key="custom_filter_val",
                           help="{0} {1}".format("Assign a filter value that isn't in the data.",
@@ -493,18 +616,22 @@ def add_filter(filter: list):
 
                 # (re-)interpret all filter values as given dtype of filter column
                 # FIXME: should this be applied to all other filter lists too?
+                # skip existing filter values of this column that have already been interpreted as this type
+                # NOTE: the new filter value is always interpreted, as this rejects invalid values
+                typed = state.filter_value_types.get((key, filter[0])) == state.filter_column_type
                 for f in state[key]:
                     # found filter column matches current filter column
-                    if f[0] == filter[0]:
-                        # find filter index
-                        i = state[key].index(f)
-                        filter_value = post.val_as_col_dtype(state[key][i][-1], filter[0]).iloc[0]
-                        # adjust filter value after typing
-                        state[key][i][-1] = str(filter_value)
+                    if f[0] == filter[0] and (f is filter or not typed):
+                        filter_value = post.val_as_col_dtype(f[-1], filter[0]).iloc[0]
+                        # adjust filter value after typing (in place)
+                        f[-1] = str(filter_value)
+                state.filter_value_types[(key, filter[0])] = state.filter_column_type
 
             except Exception as e:
                 st.exception(e)
                 post.plot = None
+                # filter values of this column may have been partially re-interpreted
+                state.filter_value_types.pop((key, filter[0]), None)
                 # remove filter from filter list
                 state[key].remove(filter)
                 # re-update filter list
@@ -568,11 +695,10 @@ def add_extra_column():
     config = state.config
 
     # warn if selected extra column is already present
-    if (len(config.plot_columns + config.extra_columns + [state.extra_col]) !=
-        len(set(config.plot_columns + config.extra_columns + [state.extra_col]))):
+    if state.extra_col in set(config.plot_columns).union(config.extra_columns):
         st.warning("Currently selected extra column is already present in the DataFrame mask.")
 
-    if state.extra_col not in state.config.extra_columns:
+    if state.extra_col not in config.extra_columns:
         # add extra column to list
         config.extra_columns.append(state.extra_col)
         # re-parse column names
@@ -591,7 +717,8 @@ def rerun_post_processing():
         # validate config
         read_config(config.to_dict())
         # reset processed df to original state
-        post.df = post.original_df.copy()
+        post.df = post.original_df.copy(deep=False)
+        post.mask_version += 1
         # run post-processing again
         post.run_post_processing(config)
 
@@ -637,23 +764,26 @@ def main():
     args = read_args()
 
     try:
-        post = PostProcessing(args.log_path)
-        # set up empty template config
-        config, err = ConfigHandler.from_template(), None
-        # optionally load config from file path
-        if args.config_path:
-            try:
-                config = ConfigHandler.from_path(args.config_path)
-                # only run post-processing with a valid config
-                post.run_post_processing(config)
-            except Exception as e:
-                err = e
-                # autofill some information from invalid config
+        post, config, err = None, None, None
+        # only read perflogs and config once per session (not on every rerun)
+        if st.session_state.get("post") is None:
+            post = PostProcessing(args.log_path)
+            # set up empty template config
+            config = ConfigHandler.from_template()
+            # optionally load config from file path
+            if args.config_path:
                 try:
-                    config = ConfigHandler.from_path(args.config_path, template=True)
+                    config = ConfigHandler.from_path(args.config_path)
+                    # only run post-processing with a valid config
+                    post.run_post_processing(config)
                 except Exception as e:
-                    print(type(e).__name__ + ":", e)
-                    print(traceback.format_exc())
+                    err = e
+                    # autofill some information from invalid config
+                    try:
+                        config = ConfigHandler.from_path(args.config_path, template=True)
+                    except Exception as e:
+                        print(type(e).__name__ + ":", e)
+                        print(traceback.format_exc())
 
         # display ui
         update_ui(post, config, e=err)
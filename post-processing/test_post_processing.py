@@ -9,6 +9,7 @@ import pytest
 from config_handler import ConfigHandler
 from perflog_handler import PerflogHandler
 from post_processing import PostProcessing
+import streamlit_post_processing as spp
 
 
 # Run given benchmark with reframe using subprocess
@@ -616,3 +617,130 @@ def test_high_level_script(run_sombrero):
     df_saved = pd.read_csv(output_file, index_col=0)
     assert df_saved.columns.tolist() == EXPECTED_FIELDS
     assert len(df_saved) == 1
+
+
+# Create a small perflog with one row per number of tasks and one row without a number of tasks
+@pytest.fixture
+def small_log_path(tmp_path):
+
+    log_path = tmp_path / "SmallBenchmark.log"
+    lines = ["job_completion_time|flops_value|flops_unit|display_name"]
+    lines += ["2023-08-23T11:36:02|{0}.5|Gflops/seconds|SmallBenchmark %tasks={0}".format(t) for t in (1, 2, 4)]
+    lines += ["2023-08-23T11:36:02|8.5|Gflops/seconds|SmallBenchmark"]
+    log_path.write_text("\n".join(lines) + "\n")
+
+    return log_path
+
+
+# Dictionary with attribute access, standing in for streamlit session state
+class SessionState(dict):
+
+    __getattr__ = dict.__getitem__
+    __setattr__ = dict.__setitem__
+
+
+# Test that an invalid filter value is rejected even if the filter column has already been typed
+def test_add_invalid_filter(small_log_path, monkeypatch):
+
+    post = PostProcessing(small_log_path, plotting=False)
+    config = ConfigHandler.from_template()
+    state = SessionState(post=post, config=config, filter_type="and", filter_column_type="int",
+                         filter_value_types={}, series=[], **{"and": [], "or": []})
+    monkeypatch.setattr(spp.st, "session_state", state)
+
+    # add valid filter, typing the filter column
+    spp.add_filter(["tasks", "==", "2"])
+    assert state["and"] == [["tasks", "==", "2"]]
+    assert state.filter_value_types[("and", "tasks")] == "int"
+
+    # invalid value for the same column and type
+    spp.add_filter(["tasks", "==", "abc"])
+    assert state["and"] == [["tasks", "==", "2"]]
+    assert config.filters["and"] == [["tasks", "==", "2"]]
+
+
+# Test that rows with missing values are filtered away instead of causing an error
+def test_filter_missing_values(small_log_path):
+
+    post = PostProcessing(small_log_path, plotting=False)
+    # missing number of tasks becomes pd.NA in a nullable integer column
+    post.apply_df_types(["tasks"], {"tasks": "int"})
+    assert post.df["tasks"].isna().sum() == 1
+
+    # missing values never match a filter
+    mask = post.filter_df([["tasks", "==", "2"]], [], [])
+    assert mask.tolist() == [False, True, False, False]
+    mask = post.filter_df([["tasks", "!=", "2"]], [], [])
+    assert mask.tolist() == [True, False, True, False]
+    mask = post.filter_df([], [["tasks", "<", "2"], ["tasks", ">", "2"]], [])
+    assert mask.tolist() == [True, False, True, False]
+    # mask can be applied directly
+    assert post.df[mask]["tasks"].tolist() == [1, 4]
+
+
+# Test that dataframe types are re-applied only when the config or the dataframe has changed
+def test_update_types(small_log_path, monkeypatch):
+
+    post = PostProcessing(small_log_path, plotting=False)
+    config = ConfigHandler(
+        {"title": "Title",
+         "x_axis": {"value": "tasks",
+                    "units": {"custom": None}},
+         "y_axis": {"value": "flops_value",
+                    "units": {"column": "flops_unit"}},
+         "filters": {"and": [["tasks", ">", 1]],
+                     "or": []},
+         "series": [],
+         "column_types": {"tasks": "int",
+                          "flops_value": "float",
+                          "flops_unit": "str"}})
+    state = SessionState(post=post, config=config)
+    monkeypatch.setattr(spp.st, "session_state", state)
+
+    # count calls to apply dataframe types
+    calls = []
+    apply_df_types = post.apply_df_types
+
+    def count_apply_df_types(*args):
+        calls.append(args)
+        apply_df_types(*args)
+
+    monkeypatch.setattr(post, "apply_df_types", count_apply_df_types)
+
+    spp.update_types()
+    assert len(calls) == 1
+    assert post.df["tasks"].dtype == "Int64"
+    assert spp._user_types(post)["tasks"] == "int"
+    # nothing has changed
+    spp.update_types()
+    assert len(calls) == 1
+
+    # changing a column type re-types the dataframe
+    config.column_types["tasks"] = "float"
+    spp.update_types()
+    assert len(calls) == 2
+    assert post.df["tasks"].dtype == "float64"
+    assert spp._user_types(post)["tasks"] == "float"
+
+    # re-running post-processing replaces the dataframe
+    spp.rerun_post_processing()
+    spp.update_types()
+    assert len(calls) == 4
+    spp.update_types()
+    assert len(calls) == 4
+
+    # a failed re-typing is retried on the next call
+    def fail_apply_df_types(*args):
+        calls.append(args)
+        raise RuntimeError("Failed to apply types")
+
+    monkeypatch.setattr(post, "apply_df_types", fail_apply_df_types)
+    config.column_types["tasks"] = "int"
+    spp.update_types()
+    assert len(calls) == 5
+    assert post.df["tasks"].dtype == "float64"
+
+    monkeypatch.setattr(post, "apply_df_types", count_apply_df_types)
+    spp.update_types()
+    assert len(calls) == 6
+    assert post.df["tasks"].dtype == "Int64"